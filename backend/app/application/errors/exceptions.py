@@ -1,4 +1,6 @@
 class AppException(RuntimeError):
+    __slots__ = ("code", "msg", "status_code")
+
     def __init__(
         self,
         code: int,
@@ -12,20 +14,28 @@ class AppException(RuntimeError):
 
 
 class NotFoundError(AppException):
+    __slots__ = ()
+
     def __init__(self, msg: str = "Resource not found"):
         super().__init__(code=404, msg=msg, status_code=404)
 
 
 class BadRequestError(AppException):
+    __slots__ = ()
+
     def __init__(self, msg: str = "Bad request parameters"):
         super().__init__(code=400, msg=msg, status_code=400)
 
 
 class ServerError(AppException):
+    __slots__ = ()
+
     def __init__(self, msg: str = "Internal server error"):
         super().__init__(code=500, msg=msg, status_code=500)
 
 
 class UnauthorizedError(AppException):
+    __slots__ = ()
+
     def __init__(self, msg: str = "Unauthorized"):
         super().__init__(code=401, msg=msg, status_code=401) 
\ No newline at end of file
@@ -1,4 +1,5 @@
 from typing import AsyncGenerator, Dict, Any, Optional, Generator, List
+import asyncio
 import logging
 from datetime import datetime
 from app.domain.models.session import Session
@@ -56,13 +57,31 @@ class AgentService:
         self._llm = llm
         self._search_engine = search_engine
         self._sandbox_cls = sandbox_cls
-    
+        # Set whenever the session list mutates, so SSE streams can wake on
+        # change instead of polling the repository on a timer
+        self._sessions_changed = asyncio.Event()
+
+    def notify_sessions_changed(self) -> None:
+        """Wake subscribers waiting on session-list changes"""
+        self._sessions_changed.set()
+
+    async def wait_sessions_changed(self, timeout: float) -> bool:
+        """Wait for a session mutation or the timeout; True when something changed"""
+        try:
+            await asyncio.wait_for(self._sessions_changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._sessions_changed.clear()
+        return True
+
+
     async def create_session(self) -> Session:
         logger.info("Creating new session")
         agent = await self._create_agent()
         session = Session(agent_id=agent.id)
         logger.info(f"Created new Session with ID: {session.id}")
         await self._session_repository.save(session)
+        self.notify_sessions_changed()
         return session
 
     async def _create_agent(self) -> Agent:
@@ -95,6 +114,8 @@ class AgentService:
         # Directly use the domain service's chat method, which will check if the session exists
         async for event in self._agent_domain_service.chat(session_id, message, timestamp, event_id, attachments):
             logger.debug(f"Received event: {event}")
+            # Events update titles/latest messages, so the list view is stale
+            self.notify_sessions_changed()
             yield event
         logger.info(f"Chat with session {session_id} completed")
     
@@ -111,9 +132,11 @@ class AgentService:
     async def delete_session(self, session_id: str):
         await self._agent_domain_service.stop_session(session_id)
         await self._session_repository.delete(session_id)
+        self.notify_sessions_changed()
 
     async def stop_session(self, session_id: str):
         await self._agent_domain_service.stop_session(session_id)
+        self.notify_sessions_changed()
 
     async def shutdown(self):
         logger.info("Closing all agents and cleaning up resources")
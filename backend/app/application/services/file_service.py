@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, BinaryIO, Tuple
+from typing import Dict, Any, AsyncIterator, Optional, BinaryIO, Tuple, Union
 import logging
 from app.domain.external.file import FileStorage
 from app.domain.models.file import FileInfo
@@ -10,7 +10,7 @@ class FileService:
     def __init__(self, file_storage: Optional[FileStorage] = None):
         self._file_storage = file_storage
 
-    async def upload_file(self, file_data: BinaryIO, filename: str, content_type: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> FileInfo:
+    async def upload_file(self, file_data: Union[BinaryIO, AsyncIterator[bytes]], filename: str, content_type: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> FileInfo:
         """Upload file"""
         if not self._file_storage:
             raise RuntimeError("File storage service not available")
@@ -22,6 +22,12 @@ class FileService:
             raise RuntimeError("File storage service not available")
         return await self._file_storage.download_file(file_id)
 
+    async def download_file_stream(self, file_id: str) -> Tuple[AsyncIterator[bytes], FileInfo]:
+        """Stream file content without buffering the whole file"""
+        if not self._file_storage:
+            raise RuntimeError("File storage service not available")
+        return await self._file_storage.download_file_stream(file_id)
+
     async def delete_file(self, file_id: str) -> bool:
         """Delete file"""
         if not self._file_storage:
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Dict, Any, Literal, Optional, Union, List, get_args
 from datetime import datetime
 import time
@@ -6,7 +6,7 @@ import uuid
 from enum import Enum
 from app.domain.models.plan import Plan, Step
 from app.domain.models.file import FileInfo
-import json
+import orjson
 
 
 class PlanStatus(str, Enum):
@@ -32,7 +32,7 @@ class ToolStatus(str, Enum):
 class BaseEvent(BaseModel):
     """Base class for agent events"""
     type: str
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     timestamp: datetime = Field(default_factory=lambda: datetime.now())
 
 class ErrorEvent(BaseEvent):
@@ -118,6 +118,10 @@ AgentEvent = Union[
     WaitEvent,
 ]
 
+# Cached pydantic-core serializer for the AgentEvent union; reused for every
+# event instead of re-walking the model with model_dump_json per call
+_EVENT_ADAPTER: TypeAdapter = TypeAdapter(AgentEvent)
+
 
 class AgentEventFactory:
     """Factory class for JSON conversion and AgentEvent manipulation"""
@@ -151,16 +155,14 @@ class AgentEventFactory:
         """Create an AgentEvent from JSON string"""
         # Build event types mapping if not done yet
         event_types = AgentEventFactory._build_event_types()
-        
-        # Parse JSON to get the event type
-        event_dict = json.loads(event_str)
-        event_type = event_dict.get("type")
-        
-        # Get the appropriate class and parse
-        event_class = event_types.get(event_type, BaseEvent)
-        return event_class.model_validate_json(event_str)
+
+        # Parse once with orjson, dispatch on the type field, then validate
+        # the dict directly — no second pass over the payload
+        event_dict = orjson.loads(event_str)
+        event_class = event_types.get(event_dict.get("type"), BaseEvent)
+        return event_class.model_validate(event_dict)
     
     @staticmethod
     def to_json(event: AgentEvent) -> str:
         """Convert an AgentEvent to JSON string"""
-        return event.model_dump_json()
+        return _EVENT_ADAPTER.dump_json(event).decode()
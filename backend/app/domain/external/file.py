@@ -1,20 +1,20 @@
-from typing import Protocol, BinaryIO, Optional, Dict, Any, Tuple
+from typing import Protocol, AsyncIterator, BinaryIO, Optional, Dict, Any, Tuple, Union
 from app.domain.models.file import FileInfo
 
 class FileStorage(Protocol):
     """File storage service interface for file upload and download operations"""
-    
+
     async def upload_file(
         self,
-        file_data: BinaryIO,
+        file_data: Union[BinaryIO, AsyncIterator[bytes]],
         filename: str,
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> FileInfo:
         """Upload file to storage
-        
+
         Args:
-            file_data: Binary file data stream
+            file_data: Binary file data stream or async iterator of chunks
             filename: Name of the file to be stored
             content_type: MIME type of the file (optional)
             metadata: Additional metadata to store with the file (optional)
@@ -37,9 +37,22 @@ class FileStorage(Protocol):
             FileDownloadResult containing file data and metadata for FastAPI streaming
         """
         ...
-    
 
-    
+    async def download_file_stream(
+        self,
+        file_id: str
+    ) -> Tuple[AsyncIterator[bytes], FileInfo]:
+        """Stream file content from storage by file ID
+
+        Args:
+            file_id: File ID
+
+        Returns:
+            Async iterator of content chunks and the file metadata
+        """
+        ...
+
+
     async def delete_file(
         self,
         file_id: str
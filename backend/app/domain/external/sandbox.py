@@ -1,4 +1,4 @@
-from typing import Any, Optional, Protocol, BinaryIO
+from typing import Any, AsyncGenerator, Optional, Protocol, BinaryIO
 from app.domain.models.tool_result import ToolResult
 from app.domain.external.browser import Browser
 from app.domain.external.llm import LLM
@@ -246,7 +246,35 @@ class Sandbox(Protocol):
             File content as binary stream
         """
         ...
-    
+
+    async def file_hash(
+        self,
+        path: str
+    ) -> ToolResult:
+        """Get SHA-256 digest of a file in sandbox
+
+        Args:
+            path: File path in sandbox
+
+        Returns:
+            Hash operation result with sha256 digest in data
+        """
+        ...
+
+    def file_download_stream(
+        self,
+        path: str
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream file content from sandbox in chunks
+
+        Args:
+            path: File path in sandbox
+
+        Yields:
+            File content chunks
+        """
+        ...
+
     async def destroy(self) -> bool:
         """Destroy current sandbox instance
         
@@ -26,10 +26,18 @@ class SessionRepository(Protocol):
     async def add_event(self, session_id: str, event: BaseEvent) -> None:
         """Add an event to a session"""
         ...
-    
+
+    async def add_events(self, session_id: str, events: List[BaseEvent]) -> None:
+        """Add multiple events to a session in a single write"""
+        ...
+
     async def add_file(self, session_id: str, file_info: FileInfo) -> None:
         """Add a file to a session"""
         ...
+
+    async def add_files(self, session_id: str, file_infos: List[FileInfo]) -> None:
+        """Add multiple files to a session in a single write"""
+        ...
     
     async def remove_file(self, session_id: str, file_id: str) -> None:
         """Remove a file from a session"""
@@ -1,6 +1,9 @@
-from typing import Optional, AsyncGenerator, List
+from typing import Optional, AsyncGenerator, List, Any, Tuple
+from collections import OrderedDict
 import asyncio
 import logging
+import os
+import time
 from app.domain.events.agent_events import (
     BaseEvent,
     ErrorEvent,
@@ -36,6 +39,16 @@ from app.domain.services.tools.mcp import MCPTool
 
 logger = logging.getLogger(__name__)
 
+# Tool content cache bounds: short TTL so repeated views of the same shell
+# session or file within one flow iteration skip the sandbox round-trip
+TOOL_CONTENT_CACHE_SIZE = 128
+TOOL_CONTENT_CACHE_TTL = 5.0
+
+# Write-behind persistence: events are flushed to Mongo in batches off the
+# streaming path; the high-water mark bounds memory if Mongo falls behind
+PERSIST_BATCH_SIZE = 64
+PERSIST_QUEUE_HIGH_WATER = 256
+
 class AgentTaskRunner(TaskRunner):
     """Agent task that can be cancelled"""
     def __init__(
@@ -64,6 +77,19 @@ class AgentTaskRunner(TaskRunner):
         self._file_storage = file_storage
         self._mcp_repository = mcp_repository
         self._mcp_tool = MCPTool()
+        self._tool_content_cache: OrderedDict[Tuple[str, str], Tuple[float, Any]] = OrderedDict()
+        self._persist_queue: asyncio.Queue[AgentEvent] = asyncio.Queue()
+        self._persist_task: Optional[asyncio.Task] = None
+        # O(1) dispatch on concrete event type instead of isinstance chains
+        self._run_event_handlers = {
+            TitleEvent: self._on_title_event,
+            MessageEvent: self._on_message_event,
+            WaitEvent: self._on_wait_event,
+        }
+        self._flow_event_handlers = {
+            ToolEvent: self._gen_tool_content,
+            MessageEvent: self._sync_message_attachments_to_storage,
+        }
         self._flow = PlanActFlow(
             self._agent_id,
             self._repository,
@@ -78,15 +104,49 @@ class AgentTaskRunner(TaskRunner):
         )
 
     async def _put_and_add_event(self, task: Task, event: AgentEvent) -> None:
-        event_id = await task.output_stream.put(event.model_dump_json())
+        event_id = await task.output_stream.put(AgentEventFactory.to_json(event))
         event.id = event_id
-        await self._session_repository.add_event(self._session_id, event)
-    
-    async def _pop_event(self, task: Task) -> AgentEvent:
+        # Persistence is not on the streaming path: hand the event to the
+        # write-behind worker and only block when Mongo falls far behind
+        self._persist_queue.put_nowait(event)
+        if self._persist_queue.qsize() >= PERSIST_QUEUE_HIGH_WATER:
+            await self._persist_queue.join()
+
+    async def _persist_events_worker(self) -> None:
+        """Drain the persistence queue, writing events to Mongo in batches"""
+        while True:
+            batch = [await self._persist_queue.get()]
+            while len(batch) < PERSIST_BATCH_SIZE:
+                try:
+                    batch.append(self._persist_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._session_repository.add_events(self._session_id, batch)
+            except Exception as e:
+                logger.exception(f"Agent {self._agent_id} failed to persist events: {e}")
+            finally:
+                for _ in batch:
+                    self._persist_queue.task_done()
+
+    async def _flush_persisted_events(self) -> None:
+        """Wait for queued events to reach Mongo, then stop the worker"""
+        if self._persist_task is None:
+            return
+        await self._persist_queue.join()
+        self._persist_task.cancel()
+        try:
+            await self._persist_task
+        except asyncio.CancelledError:
+            pass
+        self._persist_task = None
+
+
+    async def _pop_event(self, task: Task) -> Optional[AgentEvent]:
+        """Pop the next event from the input stream, None when the stream is empty"""
         event_id, event_str = await task.input_stream.pop()
         if event_str is None:
-            logger.warning(f"Agent {self._agent_id} received empty message")
-            return
+            return None
         event = AgentEventFactory.from_json(event_str)
         event.id = event_id
         return event
@@ -100,10 +160,18 @@ class AgentTaskRunner(TaskRunner):
         """Upload or update file and return FileInfo"""
         try:
             file_info = await self._session_repository.get_file_by_path(self._session_id, file_path)
-            file_data = await self._sandbox.file_download(file_path)
+            if file_info and file_info.metadata and file_info.metadata.get("sha256"):
+                # Skip the re-upload entirely when the sandbox content is unchanged
+                hash_result = await self._sandbox.file_hash(file_path)
+                if hash_result.success and hash_result.data and \
+                        hash_result.data.get("sha256") == file_info.metadata["sha256"]:
+                    return file_info
+            # Pipe sandbox download straight into storage so peak memory stays
+            # O(chunk) instead of O(file)
+            file_data = self._sandbox.file_download_stream(file_path)
             if file_info:
                 await self._session_repository.remove_file(self._session_id, file_info.file_id)
-            file_name = file_path.split("/")[-1]
+            file_name = os.path.basename(file_path)
             file_info = await self._file_storage.upload_file(file_data, file_name)
             file_info.file_path = file_path
             await self._session_repository.add_file(self._session_id, file_info)
@@ -125,32 +193,65 @@ class AgentTaskRunner(TaskRunner):
 
     async def _sync_message_attachments_to_storage(self, event: MessageEvent) -> None:
         """Sync message attachments and update event attachments"""
-        attachments: List[FileInfo] = []
+        # Most messages carry no attachments; skip the sync machinery entirely
+        if not event.attachments:
+            return
         try:
-            if event.attachments:
-                for attachment in event.attachments:
-                    file_info = await self._sync_file_to_storage(attachment.file_path)
-                    if file_info:
-                        attachments.append(file_info)
-            event.attachments = attachments
+            # Sync all attachments concurrently so wall-clock time is bounded
+            # by the slowest file instead of the sum of all files
+            results = await asyncio.gather(
+                *(self._sync_file_to_storage(attachment.file_path) for attachment in event.attachments),
+                return_exceptions=True
+            )
+            event.attachments = [result for result in results if isinstance(result, FileInfo)]
         except Exception as e:
             logger.exception(f"Agent {self._agent_id} failed to sync attachments to storage: {e}")
     
     async def _sync_message_attachments_to_sandbox(self, event: MessageEvent) -> None:
         """Sync message attachments and update event attachments"""
-        attachments: List[FileInfo] = []
+        if not event.attachments:
+            return
         try:
-            if event.attachments:
-                for attachment in event.attachments:
-                    file_info = await self._sync_file_to_sandbox(attachment.file_id)
-                    if file_info:
-                        attachments.append(file_info)
-                        await self._session_repository.add_file(self._session_id, file_info)
+            results = await asyncio.gather(
+                *(self._sync_file_to_sandbox(attachment.file_id) for attachment in event.attachments),
+                return_exceptions=True
+            )
+            attachments = [result for result in results if isinstance(result, FileInfo)]
+            await self._session_repository.add_files(self._session_id, attachments)
             event.attachments = attachments
         except Exception as e:
             logger.exception(f"Agent {self._agent_id} failed to sync attachments to event: {e}")
     
 
+    async def _on_title_event(self, event: TitleEvent) -> None:
+        await self._session_repository.update_title(self._session_id, event.title)
+
+    async def _on_message_event(self, event: MessageEvent) -> None:
+        await self._session_repository.update_latest_message(self._session_id, event.message, event.timestamp)
+        await self._session_repository.increment_unread_message_count(self._session_id)
+
+    async def _on_wait_event(self, event: WaitEvent) -> None:
+        await self._session_repository.update_status(self._session_id, SessionStatus.WAITING)
+
+    def _get_cached_tool_content(self, key: Tuple[str, str]) -> Optional[Any]:
+        """Get a cached tool content value, dropping expired entries"""
+        entry = self._tool_content_cache.get(key)
+        if not entry:
+            return None
+        expires_at, content = entry
+        if time.monotonic() > expires_at:
+            del self._tool_content_cache[key]
+            return None
+        self._tool_content_cache.move_to_end(key)
+        return content
+
+    def _set_cached_tool_content(self, key: Tuple[str, str], content: Any) -> None:
+        """Cache a tool content value with a short TTL, bounding cache size"""
+        self._tool_content_cache[key] = (time.monotonic() + TOOL_CONTENT_CACHE_TTL, content)
+        self._tool_content_cache.move_to_end(key)
+        while len(self._tool_content_cache) > TOOL_CONTENT_CACHE_SIZE:
+            self._tool_content_cache.popitem(last=False)
+
     # TODO: refactor this function
     async def _gen_tool_content(self, event: ToolEvent):
         """Generate tool content"""
@@ -162,15 +263,29 @@ class AgentTaskRunner(TaskRunner):
                     event.tool_content = SearchToolContent(results=event.function_result.data.get("results", []))
                 elif event.tool_name == "shell":
                     if "id" in event.function_args:
-                        shell_result = await self._sandbox.view_shell(event.function_args["id"])
-                        event.tool_content = ShellToolContent(console=shell_result.data.get("console", []))
+                        cache_key = ("shell", event.function_args["id"])
+                        console = self._get_cached_tool_content(cache_key)
+                        if console is None:
+                            shell_result = await self._sandbox.view_shell(event.function_args["id"])
+                            console = shell_result.data.get("console", [])
+                            self._set_cached_tool_content(cache_key, console)
+                        event.tool_content = ShellToolContent(console=console)
                     else:
                         event.tool_content = ShellToolContent(console="(No Console)")
                 elif event.tool_name == "file":
                     if "file" in event.function_args:
                         file_path = event.function_args["file"]
-                        file_read_result = await self._sandbox.file_read(file_path)
-                        file_content: str = file_read_result.data.get("content", "")
+                        cache_key = ("file", file_path)
+                        file_content: Optional[str] = None
+                        if event.function_name == "file_read":
+                            file_content = self._get_cached_tool_content(cache_key)
+                        else:
+                            # Writes invalidate whatever content was cached for this path
+                            self._tool_content_cache.pop(cache_key, None)
+                        if file_content is None:
+                            file_read_result = await self._sandbox.file_read(file_path)
+                            file_content = file_read_result.data.get("content", "")
+                            self._set_cached_tool_content(cache_key, file_content)
                         event.tool_content = FileToolContent(content=file_content)
                         await self._sync_file_to_storage(file_path)
                     else:
@@ -205,10 +320,15 @@ class AgentTaskRunner(TaskRunner):
         """Process agent's message queue and run the agent's flow"""
         try:
             logger.info(f"Agent {self._agent_id} message processing task started")
+            self._persist_task = asyncio.create_task(self._persist_events_worker())
             await self._sandbox.ensure_sandbox()
             await self._mcp_tool.initialized(await self._mcp_repository.get_mcp_config())
-            while not await task.input_stream.is_empty():
+            # pop() already reports an empty stream with (None, None), so no
+            # separate is_empty round-trip is needed per iteration
+            while True:
                 event = await self._pop_event(task)
+                if event is None:
+                    break
                 message = ""
                 if isinstance(event, MessageEvent):
                     message = event.message or ""
@@ -218,17 +338,14 @@ class AgentTaskRunner(TaskRunner):
                     
                 logger.info(f"Agent {self._agent_id} received new message: {message[:50]}...")
 
-                attachments = [attachment.file_path for attachment in event.attachments]
-                
+                attachments = [attachment.file_path for attachment in event.attachments] if event.attachments else []
+
                 async for event in self._run_flow(message, attachments):
                     await self._put_and_add_event(task, event)
-                    if isinstance(event, TitleEvent):
-                        await self._session_repository.update_title(self._session_id, event.title)
-                    elif isinstance(event, MessageEvent):
-                        await self._session_repository.update_latest_message(self._session_id, event.message, event.timestamp)
-                        await self._session_repository.increment_unread_message_count(self._session_id)
-                    elif isinstance(event, WaitEvent):
-                        await self._session_repository.update_status(self._session_id, SessionStatus.WAITING)
+                    handler = self._run_event_handlers.get(type(event))
+                    if handler:
+                        await handler(event)
+                    if type(event) is WaitEvent:
                         return
                     if not await task.input_stream.is_empty():
                         break
@@ -242,7 +359,9 @@ class AgentTaskRunner(TaskRunner):
             logger.exception(f"Agent {self._agent_id} task encountered exception: {str(e)}")
             await self._put_and_add_event(task, ErrorEvent(error=f"Task error: {str(e)}"))
             await self._session_repository.update_status(self._session_id, SessionStatus.COMPLETED)
-    
+        finally:
+            await self._flush_persisted_events()
+
     async def _run_flow(self, message: str, attachments: List[str] = []) -> AsyncGenerator[BaseEvent, None]:
         """Process a single message through the agent's flow and yield events"""
         if not message:
@@ -251,11 +370,10 @@ class AgentTaskRunner(TaskRunner):
             return
 
         async for event in self._flow.run(message, attachments):
-            if isinstance(event, ToolEvent):
-                # TODO: move to tool function
-                await self._gen_tool_content(event)
-            elif isinstance(event, MessageEvent):
-                await self._sync_message_attachments_to_storage(event)
+            # TODO: move tool content generation to tool function
+            handler = self._flow_event_handlers.get(type(event))
+            if handler:
+                await handler(event)
             yield event
 
         logger.info(f"Agent {self._agent_id} completed processing one message")
@@ -94,7 +94,7 @@ class BaseAgent(ABC):
                     continue
                 
                 function_name = tool_call["function"]["name"]
-                tool_call_id = tool_call["id"] or str(uuid.uuid4())
+                tool_call_id = tool_call["id"] or uuid.uuid4().hex
                 function_args = await self.json_parser.parse(tool_call["function"]["arguments"])
                 
                 tool = self.get_tool(function_name)
@@ -179,7 +179,7 @@ class BaseAgent(ABC):
             return
         tool_responses = []
         for tool_call in last_message.get("tool_calls"):
-            tool_call_id = tool_call["id"] or str(uuid.uuid4())
+            tool_call_id = tool_call["id"] or uuid.uuid4().hex
             tool_responses.append({
                 "role": "tool",
                 "tool_call_id": tool_call_id,
@@ -8,7 +8,7 @@ from app.domain.external.browser import Browser
 from app.domain.external.search import SearchEngine
 from app.domain.external.file import FileStorage
 from app.domain.repositories.agent_repository import AgentRepository
-from app.domain.services.prompts.execution import EXECUTION_SYSTEM_PROMPT, EXECUTION_PROMPT, CONCLUSION_PROMPT
+from app.domain.services.prompts.execution import EXECUTION_SYSTEM_PROMPT, EXECUTION_PROMPT_TEMPLATE, CONCLUSION_PROMPT
 from app.domain.events.agent_events import (
     BaseEvent,
     StepEvent,
@@ -57,7 +57,7 @@ class ExecutionAgent(BaseAgent):
         )
     
     async def execute_step(self, plan: Plan, step: Step, message: str = "", attachments: List[str] = []) -> AsyncGenerator[BaseEvent, None]:
-        message = EXECUTION_PROMPT.format(goal=plan.goal, step=step.description, message=message, attachments=attachments)
+        message = EXECUTION_PROMPT_TEMPLATE.substitute(goal=plan.goal, step=step.description, message=message, attachments=attachments)
         step.status = ExecutionStatus.RUNNING
         yield StepEvent(status=StepStatus.STARTED, step=step)
         async for event in self.execute(message):
@@ -1,4 +1,5 @@
 from typing import Dict, Any, List, AsyncGenerator, Optional
+from pydantic import BaseModel, ValidationError
 import json
 import logging
 from app.domain.models.plan import Plan, Step
@@ -6,9 +7,9 @@ from app.domain.services.agents.base import BaseAgent
 from app.domain.models.memory import Memory
 from app.domain.external.llm import LLM
 from app.domain.services.prompts.planner import (
-    PLANNER_SYSTEM_PROMPT, 
-    CREATE_PLAN_PROMPT, 
-    UPDATE_PLAN_PROMPT
+    PLANNER_SYSTEM_PROMPT,
+    CREATE_PLAN_PROMPT_TEMPLATE,
+    UPDATE_PLAN_PROMPT_TEMPLATE
 )
 from app.domain.events.agent_events import (
     BaseEvent,
@@ -27,6 +28,26 @@ from app.domain.utils.json_parser import JsonParser
 
 logger = logging.getLogger(__name__)
 
+class PlanStepResponse(BaseModel):
+    """Single step in the planner LLM's JSON reply"""
+    id: str
+    description: str
+
+class PlanResponse(BaseModel):
+    """Expected shape of the planner LLM's create-plan reply
+
+    Validated in one pydantic-core call instead of per-field dict access.
+    """
+    steps: List[PlanStepResponse]
+    goal: str
+    title: str
+    message: str
+    todo: str = ""
+
+class PlanUpdateResponse(BaseModel):
+    """Expected shape of the planner LLM's update-plan reply"""
+    steps: List[PlanStepResponse]
+
 class PlannerAgent(BaseAgent):
     """
     Planner agent class, defining the basic behavior of planning
@@ -55,25 +76,47 @@ class PlannerAgent(BaseAgent):
 
 
     async def create_plan(self, message: Optional[str] = None, attachments: List[str] = []) -> AsyncGenerator[BaseEvent, None]:
-        message = CREATE_PLAN_PROMPT.format(user_message=message, attachments=attachments) if message else None
+        message = CREATE_PLAN_PROMPT_TEMPLATE.substitute(user_message=message, attachments=attachments) if message else None
         async for event in self.execute(message):
             if isinstance(event, MessageEvent):
                 logger.info(event.message)
                 parsed_response = await self.json_parser.parse(event.message)
-                steps = [Step(id=step["id"], description=step["description"]) for step in parsed_response["steps"]]
-                plan = Plan(id=f"plan_{len(steps)}", goal=parsed_response["goal"], title=parsed_response["title"], steps=steps, message=parsed_response["message"], todo=parsed_response.get("todo", ""))
+                try:
+                    plan_response = PlanResponse.model_validate(parsed_response)
+                except ValidationError as e:
+                    logger.warning(f"Planner returned invalid plan response: {e}")
+                    yield ErrorEvent(error="Planner returned an invalid plan response")
+                    continue
+                steps = [Step(id=step.id, description=step.description) for step in plan_response.steps]
+                plan = Plan(id=f"plan_{len(steps)}", goal=plan_response.goal, title=plan_response.title, steps=steps, message=plan_response.message)
                 yield PlanEvent(status=PlanStatus.CREATED, plan=plan)
             else:
                 yield event
 
     async def update_plan(self, plan: Plan) -> AsyncGenerator[BaseEvent, None]:
-        message = UPDATE_PLAN_PROMPT.format(plan=plan.model_dump_json(include={"steps"}), goal=plan.goal)
+        message = UPDATE_PLAN_PROMPT_TEMPLATE.substitute(plan=plan.model_dump_json(include={"steps"}), goal=plan.goal)
         async for event in self.execute(message):
             if isinstance(event, MessageEvent):
                 logger.debug(f"Planner agent update plan: {event.message}")
                 parsed_response = await self.json_parser.parse(event.message)
-                new_steps = [Step(id=step["id"], description=step["description"]) for step in parsed_response["steps"]]
-                
+                try:
+                    update_response = PlanUpdateResponse.model_validate(parsed_response)
+                except ValidationError as e:
+                    logger.warning(f"Planner returned invalid plan update: {e}")
+                    yield ErrorEvent(error="Planner returned an invalid plan update")
+                    continue
+                # Reuse pending Step instances where the ID matches so an update
+                # only rewrites descriptions instead of re-validating N models
+                pending = {step.id: step for step in plan.steps if not step.is_done()}
+                new_steps = []
+                for step in update_response.steps:
+                    existing = pending.get(step.id)
+                    if existing is not None:
+                        existing.description = step.description
+                        new_steps.append(existing)
+                    else:
+                        new_steps.append(Step(id=step.id, description=step.description))
+
                 # Find the index of the first pending step
                 first_pending_index = None
                 for i, step in enumerate(plan.steps):
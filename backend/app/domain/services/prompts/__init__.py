@@ -0,0 +1,14 @@
+import re
+import string
+
+
+def compile_prompt(template: str) -> string.Template:
+    """Convert a str.format-style prompt into a string.Template
+
+    string.Template parses its pattern once at construction, so per-call
+    substitution skips the template re-parse str.format performs on every
+    call. {field} placeholders become ${field} and {{ }} escapes become
+    literal braces.
+    """
+    converted = re.sub(r"\{(\w+)\}", r"${\1}", template)
+    return string.Template(converted.replace("{{", "{").replace("}}", "}"))
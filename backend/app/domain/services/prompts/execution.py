@@ -1,3 +1,5 @@
+from app.domain.services.prompts import compile_prompt
+
 # Execution prompt
 EXECUTION_SYSTEM_PROMPT = """
 You are Manus, an AI agent created by the Manus team.
@@ -146,4 +148,6 @@ EXAMPLE JSON OUTPUT:
         "/home/ubuntu/file2.md"
     ]
 }}
-"""
\ No newline at end of file
+"""
+# Templates parsed once at import; substitute() skips str.format's per-call parse
+EXECUTION_PROMPT_TEMPLATE = compile_prompt(EXECUTION_PROMPT)
@@ -1,3 +1,5 @@
+from app.domain.services.prompts import compile_prompt
+
 # Planner prompt
 PLANNER_SYSTEM_PROMPT = """
 You are Manus, an AI agent created by the Manus team.
@@ -116,4 +118,7 @@ EXAMPLE JSON OUTPUT:
         }}
     ]
 }}
-"""
\ No newline at end of file
+"""
+# Templates parsed once at import; substitute() skips str.format's per-call parse
+CREATE_PLAN_PROMPT_TEMPLATE = compile_prompt(CREATE_PLAN_PROMPT)
+UPDATE_PLAN_PROMPT_TEMPLATE = compile_prompt(UPDATE_PLAN_PROMPT)
@@ -1,8 +1,12 @@
+import asyncio
+import hashlib
 import logging
 import io
-from typing import BinaryIO, Optional, Dict, Any, Tuple
+import urllib.parse
+from typing import AsyncIterator, BinaryIO, Optional, Dict, Any, Tuple, Union
 from datetime import datetime
 from bson import ObjectId
+from gridfs.errors import NoFile
 from motor.motor_asyncio import AsyncIOMotorGridFSBucket
 
 from app.domain.external.file import FileStorage
@@ -12,6 +16,13 @@ from app.infrastructure.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for streaming uploads, 1 MiB
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Minimum chunk size yielded on download; GridFS stores ~255 KiB chunks, so
+# several are coalesced per yield to cut ASGI send() calls on large files
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class GridFSFileStorage(FileStorage):
     """MongoDB GridFS-based file storage implementation"""
@@ -58,7 +69,7 @@ class GridFSFileStorage(FileStorage):
     
     async def upload_file(
         self,
-        file_data: BinaryIO,
+        file_data: Union[BinaryIO, AsyncIterator[bytes]],
         filename: str,
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -70,6 +81,9 @@ class GridFSFileStorage(FileStorage):
             # Prepare metadata
             file_metadata = {
                 'filename': filename,
+                # RFC 5987 form for Content-Disposition, computed once here
+                # instead of on every download
+                'encodedFilename': urllib.parse.quote(filename, safe=''),
                 'uploadDate': datetime.utcnow(),
                 **(metadata or {})
             }
@@ -77,15 +91,41 @@ class GridFSFileStorage(FileStorage):
             if content_type:
                 file_metadata['contentType'] = content_type
             
-            # Upload directly from file stream to avoid loading entire file into memory
-            file_id = await bucket.upload_from_stream(
+            # Stream the file in chunks to avoid loading it entirely into memory.
+            # Reads happen in a worker thread so a slow disk-backed stream
+            # (e.g. a SpooledTemporaryFile from an upload) never blocks the event loop.
+            grid_in = bucket.open_upload_stream(
                 filename,
-                file_data,
                 metadata=file_metadata
             )
-            
-            # Get file size (can be retrieved from GridFS if needed)
+            digest = hashlib.sha256()
+            try:
+                if hasattr(file_data, "__aiter__"):
+                    # Async chunk iterator (e.g. a streamed sandbox download):
+                    # pipe chunks straight into GridFS without buffering the file
+                    async for chunk in file_data:
+                        digest.update(chunk)
+                        await grid_in.write(chunk)
+                else:
+                    while True:
+                        chunk = await asyncio.to_thread(file_data.read, UPLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        digest.update(chunk)
+                        await grid_in.write(chunk)
+            finally:
+                await grid_in.close()
+            file_id = grid_in._id
+
+            # Record the content hash so callers can skip re-uploading unchanged files
+            file_metadata['sha256'] = digest.hexdigest()
             files_collection = self._get_files_collection()
+            await files_collection.update_one(
+                {"_id": file_id},
+                {"$set": {"metadata.sha256": file_metadata['sha256']}}
+            )
+
+            # Get file size (can be retrieved from GridFS if needed)
             file_info = await files_collection.find_one({"_id": file_id})
             file_size = file_info.get('length', 0) if file_info else 0
             
@@ -131,28 +171,65 @@ class GridFSFileStorage(FileStorage):
             logger.error(f"Failed to download file {file_id}: {str(e)}")
             raise
     
-    async def delete_file(self, file_id: str) -> bool:
-        """Delete file"""
+    async def download_file_stream(self, file_id: str) -> Tuple[AsyncIterator[bytes], FileInfo]:
+        """Stream file content by file ID without buffering the whole file"""
         try:
             bucket = self._get_gridfs_bucket()
             files_collection = self._get_files_collection()
-            
+
             # Convert ObjectId
             try:
                 obj_id = ObjectId(file_id)
             except Exception:
                 raise ValueError(f"Invalid file ID format: {file_id}")
-            
-            # Check if file exists
+
+            # Get file information
             file_info = await files_collection.find_one({"_id": obj_id})
             if not file_info:
+                raise FileNotFoundError(f"File not found with ID: {file_id}")
+
+            async def stream() -> AsyncIterator[bytes]:
+                grid_out = await bucket.open_download_stream(obj_id)
+                buffer = bytearray()
+                while True:
+                    chunk = await grid_out.readchunk()
+                    if not chunk:
+                        break
+                    buffer += chunk
+                    if len(buffer) >= DOWNLOAD_CHUNK_SIZE:
+                        yield bytes(buffer)
+                        buffer.clear()
+                if buffer:
+                    yield bytes(buffer)
+
+            return stream(), self._create_file_info(file_info, file_id)
+
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to stream file {file_id}: {str(e)}")
+            raise
+
+    async def delete_file(self, file_id: str) -> bool:
+        """Delete file"""
+        try:
+            bucket = self._get_gridfs_bucket()
+
+            # Convert ObjectId
+            try:
+                obj_id = ObjectId(file_id)
+            except Exception:
+                raise ValueError(f"Invalid file ID format: {file_id}")
+
+            # Delete directly; GridFS raises NoFile for unknown IDs, so no
+            # separate existence check round-trip is needed
+            try:
+                await bucket.delete(obj_id)
+            except NoFile:
                 return False
-            
-            # Delete file
-            await bucket.delete(obj_id)
             logger.info(f"File deleted successfully: {file_id}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to delete file {file_id}: {str(e)}")
             return False
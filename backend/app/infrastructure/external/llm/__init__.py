@@ -1,18 +1,27 @@
+from functools import lru_cache
+
 from app.infrastructure.config import get_settings
 from app.domain.external.llm import LLM
 from app.infrastructure.external.llm.openai_llm import OpenAILLM
 from app.infrastructure.external.llm.gemini_llm import GeminiLLM
+from app.infrastructure.external.llm.cached_llm import CachedLLM
 
+@lru_cache(maxsize=1)
 def get_llm() -> LLM:
     """
-    Returns an instance of the LLM based on the provider specified in the settings.
+    Returns the process-wide LLM instance for the configured provider.
+    Cached so every caller shares one client — and with it the underlying
+    HTTP connection pool — instead of rebuilding both per call.
+    The provider is wrapped in CachedLLM so deterministic (temperature 0)
+    requests are served from an in-process cache.
     """
     settings = get_settings()
     provider = getattr(settings, 'model_provider', 'openai')
 
     if provider == 'gemini':
-        return GeminiLLM()
+        llm = GeminiLLM()
     elif provider == 'openai':
-        return OpenAILLM()
+        llm = OpenAILLM()
     else:
         raise ValueError(f"Unsupported LLM provider: {provider}")
+    return CachedLLM(llm)
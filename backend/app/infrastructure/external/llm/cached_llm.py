@@ -0,0 +1,104 @@
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+from app.domain.external.llm import LLM
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of cached responses kept in memory
+CACHE_MAX_SIZE = 256
+
+
+class CachedLLM(LLM):
+    """LLM wrapper that caches responses of deterministic requests
+
+    Only requests made at temperature 0 are cached: identical prompts then
+    produce identical completions, so a repeated request can be served from
+    memory instead of paying a full API round-trip and token cost.
+    Requests at any other temperature pass straight through.
+    """
+
+    def __init__(self, llm: LLM, max_size: int = CACHE_MAX_SIZE):
+        self._llm = llm
+        self._max_size = max_size
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def model_name(self) -> str:
+        return self._llm.model_name
+
+    @property
+    def temperature(self) -> float:
+        return self._llm.temperature
+
+    @property
+    def max_tokens(self) -> int:
+        return self._llm.max_tokens
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]],
+        response_format: Optional[Dict[str, Any]],
+        tool_choice: Optional[str]
+    ) -> str:
+        """Hash the canonicalized request payload"""
+        payload = json.dumps(
+            {
+                "model": self._llm.model_name,
+                "messages": messages,
+                "tools": tools,
+                "response_format": response_format,
+                "tool_choice": tool_choice,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def ask(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        tool_choice: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send chat request, serving deterministic repeats from cache"""
+        if self._llm.temperature != 0:
+            return await self._llm.ask(
+                messages,
+                tools=tools,
+                response_format=response_format,
+                tool_choice=tool_choice
+            )
+
+        key = self._cache_key(messages, tools, response_format, tool_choice)
+        async with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                logger.debug(f"LLM cache hit ({self._hits} hits, {self._misses} misses)")
+                # Copy so callers can mutate the response without poisoning the cache
+                return copy.deepcopy(cached)
+
+        self._misses += 1
+        response = await self._llm.ask(
+            messages,
+            tools=tools,
+            response_format=response_format,
+            tool_choice=tool_choice
+        )
+        async with self._lock:
+            self._cache[key] = copy.deepcopy(response)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+        return response
@@ -1,15 +1,36 @@
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
+import asyncio
+import time
 import google.generativeai as genai
+from google.api_core.exceptions import ResourceExhausted, ServerError
 from app.domain.external.llm import LLM
 from app.infrastructure.config import get_settings
+from app.infrastructure.external.llm.rate_limiter import SlidingWindowRateLimiter, AIMDController
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cap on concurrent Gemini calls so batched gathers saturate the provider
+# without tripping its rate limits
+GEMINI_MAX_CONCURRENCY = 10
+
+# Provider budget defaults; adjust to the deployed tier
+GEMINI_RPM_LIMIT = 60
+GEMINI_TPM_LIMIT = 1_000_000
+
+# Bounded exponential backoff for rate-limit retries
+GEMINI_MAX_RETRIES = 3
+GEMINI_RETRY_BASE_DELAY = 1.0
+
+# Domain role -> Gemini role; roles outside the map are dropped
+_GEMINI_ROLE = {"user": "user", "assistant": "model"}
+
 class GeminiLLM(LLM):
     def __init__(self):
         settings = get_settings()
-        genai.configure(api_key=settings.gemini_api_key)
+        # grpc_asyncio multiplexes concurrent calls over one HTTP/2 channel,
+        # so gathered requests are not serialized behind a small REST pool
+        genai.configure(api_key=settings.gemini_api_key, transport="grpc_asyncio")
         
         self._model_name = settings.model_name
         self._temperature = settings.temperature
@@ -22,6 +43,8 @@ class GeminiLLM(LLM):
                 "max_output_tokens": self._max_tokens,
             }
         )
+        self._rate_limiter = SlidingWindowRateLimiter(rpm=GEMINI_RPM_LIMIT, tpm=GEMINI_TPM_LIMIT)
+        self._controller = AIMDController(maximum=GEMINI_MAX_CONCURRENCY)
         logger.info(f"Initialized Gemini LLM with model: {self._model_name}")
 
     @property
@@ -46,12 +69,37 @@ class GeminiLLM(LLM):
             
             # Convert messages to the format expected by Gemini
             gemini_messages = self._convert_messages_to_gemini_format(messages)
-            
-            response = await self.client.generate_content_async(
-                gemini_messages,
-                tools=tools,
-            )
-            
+
+            response = None
+            for attempt in range(GEMINI_MAX_RETRIES + 1):
+                # Stay inside the provider's RPM/TPM window, then take an
+                # in-flight slot from the adaptive concurrency controller
+                await self._rate_limiter.wait_if_throttled()
+                await self._controller.acquire()
+                started = time.monotonic()
+                try:
+                    response = await self.client.generate_content_async(
+                        gemini_messages,
+                        tools=tools,
+                    )
+                except (ResourceExhausted, ServerError) as e:
+                    self._controller.on_error()
+                    if attempt >= GEMINI_MAX_RETRIES:
+                        raise
+                    delay = GEMINI_RETRY_BASE_DELAY * (2 ** attempt)
+                    self._rate_limiter.reseed(delay)
+                    logger.warning(f"Gemini API throttled ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                finally:
+                    await self._controller.release()
+                self._controller.on_success(time.monotonic() - started)
+                break
+
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                self._rate_limiter.record_tokens(getattr(usage, "total_token_count", 0))
+
             # Extract the response content
             response_text = response.candidates[0].content.parts[0].text
             
@@ -64,15 +112,36 @@ class GeminiLLM(LLM):
             logger.error(f"Error calling Gemini API: {str(e)}")
             raise
 
+    async def ask_stream(self, messages: List[Dict[str, str]],
+                         tools: Optional[List[Dict[str, Any]]] = None) -> AsyncIterator[str]:
+        """Stream response text from Gemini chunk by chunk as it is generated"""
+        gemini_messages = self._convert_messages_to_gemini_format(messages)
+        await self._rate_limiter.wait_if_throttled()
+        await self._controller.acquire()
+        started = time.monotonic()
+        try:
+            response = await self.client.generate_content_async(
+                gemini_messages,
+                tools=tools,
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except (ResourceExhausted, ServerError):
+            self._controller.on_error()
+            raise
+        finally:
+            await self._controller.release()
+        self._controller.on_success(time.monotonic() - started)
+
+    async def ask_many(self, requests: List[List[Dict[str, str]]]) -> List[Dict[str, Any]]:
+        """Run several chat requests concurrently, bounded by the semaphore"""
+        return await asyncio.gather(*(self.ask(messages) for messages in requests))
+
     def _convert_messages_to_gemini_format(self, messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
-        gemini_messages = []
-        for message in messages:
-            role = message.get("role")
-            content = message.get("content")
-            
-            if role == "user":
-                gemini_messages.append({"role": "user", "parts": [{"text": content}]})
-            elif role == "assistant":
-                gemini_messages.append({"role": "model", "parts": [{"text": content}]})
-        
-        return gemini_messages
+        return [
+            {"role": _GEMINI_ROLE[message["role"]], "parts": [{"text": message.get("content")}]}
+            for message in messages
+            if message.get("role") in _GEMINI_ROLE
+        ]
@@ -0,0 +1,120 @@
+from typing import Optional
+import asyncio
+import time
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Sliding-window length for provider RPM/TPM accounting
+RATE_WINDOW_SECONDS = 60.0
+
+
+class SlidingWindowRateLimiter:
+    """Request/token budget over a sliding one-minute window.
+
+    Callers await wait_if_throttled() before each provider call; when the
+    window is full the coroutine sleeps until the oldest entry expires
+    instead of firing a request that would come back as a 429.
+    """
+
+    def __init__(self, rpm: int, tpm: Optional[int] = None):
+        self._rpm = rpm
+        self._tpm = tpm
+        self._requests: deque = deque()
+        self._tokens: deque = deque()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - RATE_WINDOW_SECONDS
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._tokens.popleft()
+
+    def _token_total(self) -> int:
+        return sum(count for _, count in self._tokens)
+
+    async def wait_if_throttled(self) -> None:
+        """Reserve a request slot, sleeping until the window has room"""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._evict(now)
+                if now >= self._blocked_until and len(self._requests) < self._rpm \
+                        and (self._tpm is None or self._token_total() < self._tpm):
+                    self._requests.append(now)
+                    return
+                wait = max(self._blocked_until - now, 0.0)
+                if self._requests:
+                    wait = max(wait, self._requests[0] + RATE_WINDOW_SECONDS - now)
+            await asyncio.sleep(max(wait, 0.05))
+
+    def record_tokens(self, count: int) -> None:
+        """Charge consumed tokens against the TPM window"""
+        if self._tpm is not None and count:
+            self._tokens.append((time.monotonic(), count))
+
+    def reseed(self, retry_after: float) -> None:
+        """Block the window for the provider-advertised retry delay"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+class AIMDController:
+    """Additive-increase/multiplicative-decrease concurrency controller.
+
+    The in-flight cap grows by alpha after each call whose latency stays at
+    or below the rolling target, and is cut by beta on a rate-limit or
+    server error — the TCP congestion-avoidance scheme applied to LLM calls.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 10,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        latency_window: int = 32,
+    ):
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._alpha = alpha
+        self._beta = beta
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._inflight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            while self._inflight >= self.limit:
+                await self._condition.wait()
+            self._inflight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._inflight -= 1
+            self._condition.notify()
+
+    def _latency_target(self) -> float:
+        if not self._latencies:
+            return float("inf")
+        return sum(self._latencies) / len(self._latencies)
+
+    def on_success(self, latency: float) -> None:
+        """Additive increase while latency stays at or below the rolling mean"""
+        target = self._latency_target()
+        self._latencies.append(latency)
+        if latency <= target:
+            self._limit = min(float(self._maximum), self._limit + self._alpha)
+
+    def on_error(self) -> None:
+        """Multiplicative decrease on 429/5xx responses"""
+        self._limit = max(float(self._minimum), self._limit * self._beta)
+        logger.warning(f"LLM concurrency limit decreased to {self.limit}")
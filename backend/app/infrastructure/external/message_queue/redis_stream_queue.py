@@ -26,7 +26,7 @@ class RedisStreamQueue(MessageQueue):
         Returns:
             str: Lock value if acquired successfully, None otherwise
         """
-        lock_value = str(uuid.uuid4())
+        lock_value = uuid.uuid4().hex
         end_time = timeout_seconds
         
         while end_time > 0:
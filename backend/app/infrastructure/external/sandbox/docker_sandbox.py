@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional, List, BinaryIO
+from typing import Dict, Any, AsyncGenerator, Optional, List, BinaryIO
 import uuid
 import httpx
 import docker
@@ -83,7 +83,7 @@ class DockerSandbox(Sandbox):
 
         image = settings.sandbox_image
         name_prefix = settings.sandbox_name_prefix
-        container_name = f"{name_prefix}-{str(uuid.uuid4())[:8]}"
+        container_name = f"{name_prefix}-{uuid.uuid4().hex[:8]}"
         
         try:
             # Create Docker client
@@ -405,6 +405,21 @@ class DockerSandbox(Sandbox):
         )
         return ToolResult(**response.json())
 
+    async def file_hash(self, path: str) -> ToolResult:
+        """Get SHA-256 digest of a file in sandbox
+
+        Args:
+            path: File path in sandbox
+
+        Returns:
+            Hash operation result with sha256 digest in data
+        """
+        response = await self.client.post(
+            f"{self.base_url}/api/v1/file/hash",
+            json={"file": path}
+        )
+        return ToolResult(**response.json())
+
     async def file_download(self, path: str) -> BinaryIO:
         """Download file from sandbox
         
@@ -423,7 +438,25 @@ class DockerSandbox(Sandbox):
         # Return the response content as a BinaryIO stream
         # TODO: change to real stream
         return io.BytesIO(response.content)
-    
+
+    async def file_download_stream(self, path: str) -> AsyncGenerator[bytes, None]:
+        """Stream file content from sandbox in chunks
+
+        Args:
+            path: File path in sandbox
+
+        Yields:
+            File content chunks
+        """
+        async with self.client.stream(
+            "GET",
+            f"{self.base_url}/api/v1/file/download",
+            params={"path": path}
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                yield chunk
+
     @staticmethod
     @alru_cache(maxsize=128, typed=True)
     async def _resolve_hostname_to_ip(hostname: str) -> str:
@@ -21,7 +21,7 @@ class RedisStreamTask(Task):
             runner: The TaskRunner instance that will execute this task
         """
         self._runner = runner
-        self._id = str(uuid.uuid4())
+        self._id = uuid.uuid4().hex
         self._execution_task: Optional[asyncio.Task] = None
         
         # Create input/output streams based on task ID
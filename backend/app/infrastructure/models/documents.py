@@ -1,6 +1,8 @@
 from typing import Dict, Optional, List
 from datetime import datetime, timezone
 from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 from app.domain.models.memory import Memory
 from app.domain.events.agent_events import AgentEvent
 from app.domain.models.session import SessionStatus
@@ -13,13 +15,14 @@ class AgentDocument(Document):
     temperature: float
     max_tokens: int
     memories: Dict[str, Memory] = {}
-    created_at: datetime = datetime.now(timezone.utc)
-    updated_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "agents"
         indexes = [
-            "agent_id",
+            # Unique so lookups short-circuit after the first B-tree hit
+            IndexModel([("agent_id", ASCENDING)], unique=True),
         ]
 
 
@@ -33,13 +36,13 @@ class SessionDocument(Document):
     unread_message_count: int = 0
     latest_message: Optional[str] = None
     latest_message_at: Optional[datetime] = None
-    created_at: datetime = datetime.now(timezone.utc)
-    updated_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     events: List[AgentEvent]
     status: SessionStatus
     files: List[FileInfo] = []
     class Settings:
         name = "sessions"
         indexes = [
-            "session_id",
+            IndexModel([("session_id", ASCENDING)], unique=True),
         ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Optional, List
 from datetime import datetime, UTC
+from pydantic import BaseModel
 from app.domain.models.session import Session, SessionStatus
 from app.domain.models.file import FileInfo
 from app.domain.repositories.session_repository import SessionRepository
@@ -9,6 +10,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+class SessionSummaryProjection(BaseModel):
+    """Projection for session listings
+
+    Excludes the events and files arrays so listing queries don't pay the
+    BSON decode and network cost of full session histories.
+    """
+    session_id: str
+    sandbox_id: Optional[str] = None
+    agent_id: str
+    task_id: Optional[str] = None
+    title: Optional[str] = None
+    unread_message_count: int = 0
+    latest_message: Optional[str] = None
+    latest_message_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    status: SessionStatus
+
 class MongoSessionRepository(SessionRepository):
     """MongoDB implementation of SessionRepository"""
     
@@ -70,6 +89,18 @@ class MongoSessionRepository(SessionRepository):
         if not result:
             raise ValueError(f"Session {session_id} not found")
 
+    async def add_events(self, session_id: str, events: List[BaseEvent]) -> None:
+        """Add multiple events to a session in a single write"""
+        if not events:
+            return
+        result = await SessionDocument.find_one(
+            SessionDocument.session_id == session_id
+        ).update(
+            {"$push": {"events": {"$each": list(events)}}, "$set": {"updated_at": datetime.now(UTC)}}
+        )
+        if not result:
+            raise ValueError(f"Session {session_id} not found")
+
     async def add_file(self, session_id: str, file_info: FileInfo) -> None:
         """Add a file to a session"""
         result = await SessionDocument.find_one(
@@ -80,6 +111,18 @@ class MongoSessionRepository(SessionRepository):
         if not result:
             raise ValueError(f"Session {session_id} not found")
 
+    async def add_files(self, session_id: str, file_infos: List[FileInfo]) -> None:
+        """Add multiple files to a session in a single write"""
+        if not file_infos:
+            return
+        result = await SessionDocument.find_one(
+            SessionDocument.session_id == session_id
+        ).update(
+            {"$push": {"files": {"$each": list(file_infos)}}, "$set": {"updated_at": datetime.now(UTC)}}
+        )
+        if not result:
+            raise ValueError(f"Session {session_id} not found")
+
     async def remove_file(self, session_id: str, file_id: str) -> None:
         """Remove a file from a session"""
         result = await SessionDocument.find_one(
@@ -113,8 +156,8 @@ class MongoSessionRepository(SessionRepository):
             await mongo_session.delete()
 
     async def get_all(self) -> List[Session]:
-        """Get all sessions"""
-        mongo_sessions = await SessionDocument.find().sort("-latest_message_at").to_list()
+        """Get all sessions as summaries (without events and files)"""
+        mongo_sessions = await SessionDocument.find().sort("-latest_message_at").project(SessionSummaryProjection).to_list()
         return [self._to_domain_session(mongo_session) for mongo_session in mongo_sessions]
     
     async def update_status(self, session_id: str, status: SessionStatus) -> None:
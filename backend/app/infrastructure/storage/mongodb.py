@@ -1,45 +1,62 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
 from typing import Optional
+import asyncio
 import logging
 from functools import lru_cache
 from app.infrastructure.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pool bounds shared by all Mongo operations in the process
+MONGODB_MAX_POOL_SIZE = 100
+MONGODB_MIN_POOL_SIZE = 10
+
 class MongoDB:
     def __init__(self):
         self._client: Optional[AsyncIOMotorClient] = None
         self._settings = get_settings()
-    
+        self._init_lock = asyncio.Lock()
+
     async def initialize(self) -> None:
         """Initialize MongoDB connection and Beanie ODM."""
         if self._client is not None:
             return
-            
-        try:
-            # Connect to MongoDB
-            if self._settings.mongodb_username and self._settings.mongodb_password:
-                # Use authenticated connection if username and password are configured
-                self._client = AsyncIOMotorClient(
-                    self._settings.mongodb_uri,
-                    username=self._settings.mongodb_username,
-                    password=self._settings.mongodb_password,
-                )
-            else:
-                # Use unauthenticated connection if no credentials are provided
-                self._client = AsyncIOMotorClient(
-                    self._settings.mongodb_uri,
-                )
-            # Verify the connection
-            await self._client.admin.command('ping')
-            logger.info("Successfully connected to MongoDB")
-        except ConnectionFailure as e:
-            logger.error(f"Failed to connect to MongoDB: {str(e)}")
-            raise
-        except Exception as e:
-            logger.error(f"Failed to initialize Beanie: {str(e)}")
-            raise
+
+        # Serialize concurrent first calls so only one client is created
+        async with self._init_lock:
+            if self._client is not None:
+                return
+
+            try:
+                # Connect to MongoDB
+                if self._settings.mongodb_username and self._settings.mongodb_password:
+                    # Use authenticated connection if username and password are configured
+                    self._client = AsyncIOMotorClient(
+                        self._settings.mongodb_uri,
+                        username=self._settings.mongodb_username,
+                        password=self._settings.mongodb_password,
+                        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                        minPoolSize=MONGODB_MIN_POOL_SIZE,
+                    )
+                else:
+                    # Use unauthenticated connection if no credentials are provided
+                    self._client = AsyncIOMotorClient(
+                        self._settings.mongodb_uri,
+                        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                        minPoolSize=MONGODB_MIN_POOL_SIZE,
+                    )
+                # Verify the connection
+                await self._client.admin.command('ping')
+                logger.info("Successfully connected to MongoDB")
+            except ConnectionFailure as e:
+                self._client = None
+                logger.error(f"Failed to connect to MongoDB: {str(e)}")
+                raise
+            except Exception as e:
+                self._client = None
+                logger.error(f"Failed to initialize Beanie: {str(e)}")
+                raise
     
     async def shutdown(self) -> None:
         """Shutdown MongoDB connection."""
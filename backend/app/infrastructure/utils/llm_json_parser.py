@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 import logging
 
+import orjson
+
 from app.domain.utils.json_parser import JsonParser
 from app.infrastructure.external.llm import get_llm
 
@@ -79,8 +81,12 @@ class LLMJsonParser(JsonParser):
         raise ValueError(f"Failed to parse JSON from LLM output: {text[:1000]}...")
     
     async def _try_direct_parse(self, text: str) -> Optional[Any]:
-        """Try to parse the text directly as JSON"""
-        return json.loads(text)
+        """Try to parse the text directly as JSON
+
+        Uses orjson for the happy path; the repair strategies below keep
+        using stdlib json since they run only on malformed output.
+        """
+        return orjson.loads(text)
     
     async def _try_markdown_block_parse(self, text: str) -> Optional[Any]:
         """Extract and parse JSON from markdown code blocks"""
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
 from fastapi.responses import StreamingResponse
+from functools import lru_cache
 from typing import Optional
 import logging
+import urllib.parse
 
 from app.application.services.file_service import FileService
 from app.application.errors.exceptions import NotFoundError
-from app.infrastructure.external.file.gridfsfile import GridFSFileStorage
+from app.infrastructure.external.file.gridfsfile import GridFSFileStorage, UPLOAD_CHUNK_SIZE
 from app.infrastructure.storage.mongodb import get_mongodb
 from app.interfaces.schemas.response import (
     APIResponse, FileUploadResponse, FileInfoResponse,
@@ -13,27 +15,42 @@ from app.interfaces.schemas.response import (
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
 def get_file_service() -> FileService:
-    """Create FileService instance with GridFS file storage"""
+    """Shared FileService instance with GridFS file storage
+
+    Both objects are stateless wrappers around the MongoDB singleton, so
+    one instance serves every request instead of being rebuilt per call.
+    """
     file_storage = GridFSFileStorage(mongodb=get_mongodb())
     return FileService(file_storage=file_storage)
 
 router = APIRouter(prefix="/files", tags=["files"])
 
+# Shared empty-success payload; the model is never mutated after creation
+_EMPTY_OK: APIResponse[None] = APIResponse.success()
+
 @router.post("", response_model=APIResponse[FileUploadResponse])
 async def upload_file(
     file: UploadFile = File(...),
     file_service: FileService = Depends(get_file_service)
 ) -> APIResponse[FileUploadResponse]:
     """Upload file"""
-    # Upload file
+    # Read through UploadFile's async interface in 1 MiB chunks so spooled
+    # uploads never block the event loop and storage sees a bounded stream
+    async def file_chunks():
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
     result = await file_service.upload_file(
-        file_data=file.file,
+        file_data=file_chunks(),
         filename=file.filename,
         content_type=file.content_type
     )
     
-    return APIResponse.success(FileUploadResponse(
+    # Fields come from the validated FileInfo domain model, so skip a second
+    # validation pass when building the response
+    return APIResponse.success(FileUploadResponse.model_construct(
         file_id=result.file_id,
         filename=result.filename,
         size=result.size,
@@ -48,15 +65,16 @@ async def download_file(
 ):
     """Download file"""
     try:
-        file_data, file_info = await file_service.download_file(file_id)
+        file_data, file_info = await file_service.download_file_stream(file_id)
     except FileNotFoundError:
         raise NotFoundError("File not found")
     
     # Encode filename properly for Content-Disposition header
-    # Use URL encoding for non-ASCII characters to ensure latin-1 compatibility
-    import urllib.parse
-    encoded_filename = urllib.parse.quote(file_info.filename, safe='')
-    
+    # Use URL encoding for non-ASCII characters to ensure latin-1 compatibility;
+    # uploads store the encoded form in metadata, older files fall back to quoting here
+    encoded_filename = (file_info.metadata or {}).get('encodedFilename') \
+        or urllib.parse.quote(file_info.filename, safe='')
+
     headers = {
         'Content-Disposition': f'attachment; filename*=UTF-8\'\'{encoded_filename}'
     }
@@ -76,7 +94,7 @@ async def delete_file(
     success = await file_service.delete_file(file_id)
     if not success:
         raise NotFoundError("File not found")
-    return APIResponse.success()
+    return _EMPTY_OK
 
 @router.get("/{file_id}/info", response_model=APIResponse[FileInfoResponse])
 async def get_file_info(
@@ -88,7 +106,7 @@ async def get_file_info(
     if not file_info:
         raise NotFoundError("File not found")
     
-    return APIResponse.success(FileInfoResponse(
+    return APIResponse.success(FileInfoResponse.model_construct(
         file_id=file_info.file_id,
         filename=file_info.filename,
         content_type=file_info.content_type,
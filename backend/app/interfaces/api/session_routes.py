@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from sse_starlette.sse import EventSourceResponse
-from typing import AsyncGenerator, List
+from typing import AsyncGenerator, List, Optional, Set
 from sse_starlette.event import ServerSentEvent
 from datetime import datetime
 import asyncio
@@ -17,7 +17,8 @@ from app.interfaces.schemas.event import SSEEventFactory
 from app.domain.models.file import FileInfo
 
 logger = logging.getLogger(__name__)
-SESSION_POLL_INTERVAL = 5
+# Longest time a session SSE stream sits idle before re-emitting a keepalive
+SESSION_KEEPALIVE_INTERVAL = 30
 TOOL_POLL_INTERVAL = 5
 
 def get_agent_service() -> AgentService:
@@ -26,6 +27,102 @@ def get_agent_service() -> AgentService:
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+# Shared empty-success payload; the model is never mutated after creation
+_EMPTY_OK: APIResponse[None] = APIResponse.success()
+
+# Per-subscriber queue depth; only the newest snapshot matters, so stale
+# entries are dropped when a slow client falls behind
+SESSION_SUBSCRIBER_QUEUE_SIZE = 8
+
+
+def _build_sessions_response(sessions: List) -> ListSessionResponse:
+    """Build the session-list response shared by the REST and SSE endpoints
+
+    model_construct skips re-validating fields that come straight from the
+    validated Session domain models.
+    """
+    session_items = [
+        ListSessionItem.model_construct(
+            session_id=session.id,
+            title=session.title,
+            status=session.status,
+            unread_message_count=session.unread_message_count,
+            latest_message=session.latest_message,
+            latest_message_at=int(session.latest_message_at.timestamp()) if session.latest_message_at else None
+        ) for session in sessions
+    ]
+    return ListSessionResponse(sessions=session_items)
+
+
+def _build_sessions_payload(sessions: List) -> str:
+    """Serialize the session list once for every subscriber of a tick"""
+    return _build_sessions_response(sessions).model_dump_json()
+
+
+class SessionBroadcaster:
+    """Fan-out for the session-list SSE stream.
+
+    One producer task queries and serializes the list per change and pushes
+    the payload to every subscriber queue, so DB and JSON work stay O(1) in
+    the number of connected clients.
+    """
+
+    def __init__(self):
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._producer: Optional[asyncio.Task] = None
+        self._last_payload: Optional[str] = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, agent_service: AgentService) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SESSION_SUBSCRIBER_QUEUE_SIZE)
+        async with self._lock:
+            self._subscribers.add(queue)
+            if self._last_payload is not None:
+                # New clients get the current snapshot immediately
+                queue.put_nowait(self._last_payload)
+            if self._producer is None or self._producer.done():
+                self._producer = asyncio.create_task(self._run(agent_service))
+        return queue
+
+    async def unsubscribe(self, queue: asyncio.Queue) -> None:
+        async with self._lock:
+            self._subscribers.discard(queue)
+            if not self._subscribers and self._producer is not None:
+                # Nobody is listening; stop polling entirely
+                self._producer.cancel()
+                self._producer = None
+                self._last_payload = None
+
+    def _publish(self, payload: str) -> None:
+        for queue in self._subscribers:
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(payload)
+
+    async def _run(self, agent_service: AgentService) -> None:
+        while True:
+            try:
+                sessions = await agent_service.get_all_sessions()
+                payload = _build_sessions_payload(sessions)
+                if payload != self._last_payload:
+                    self._last_payload = payload
+                    self._publish(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Session broadcast tick failed: {e}")
+            await agent_service.wait_sessions_changed(SESSION_KEEPALIVE_INTERVAL)
+
+
+_session_broadcaster = SessionBroadcaster()
+
+
+class _StreamClosed(Exception):
+    """Sentinel raised when one side of the VNC passthrough closes"""
+
 @router.put("", response_model=APIResponse[CreateSessionResponse])
 async def create_session(
     agent_service: AgentService = Depends(get_agent_service)
@@ -55,7 +152,7 @@ async def delete_session(
     agent_service: AgentService = Depends(get_agent_service)
 ) -> APIResponse[None]:
     await agent_service.delete_session(session_id)
-    return APIResponse.success()
+    return _EMPTY_OK
 
 @router.post("/{session_id}/stop", response_model=APIResponse[None])
 async def stop_session(
@@ -63,47 +160,27 @@ async def stop_session(
     agent_service: AgentService = Depends(get_agent_service)
 ) -> APIResponse[None]:
     await agent_service.stop_session(session_id)
-    return APIResponse.success()
+    return _EMPTY_OK
 
 @router.get("", response_model=APIResponse[ListSessionResponse])
 async def get_all_sessions(
     agent_service: AgentService = Depends(get_agent_service)
 ) -> APIResponse[ListSessionResponse]:
     sessions = await agent_service.get_all_sessions()
-    session_items = [
-        ListSessionItem(
-            session_id=session.id,
-            title=session.title,
-            status=session.status,
-            unread_message_count=session.unread_message_count,
-            latest_message=session.latest_message,
-            latest_message_at=int(session.latest_message_at.timestamp()) if session.latest_message_at else None
-        ) for session in sessions
-    ]
-    return APIResponse.success(ListSessionResponse(sessions=session_items))
+    return APIResponse.success(_build_sessions_response(sessions))
 
 @router.post("")
 async def stream_sessions(
     agent_service: AgentService = Depends(get_agent_service)
 ) -> EventSourceResponse:
     async def event_generator() -> AsyncGenerator[ServerSentEvent, None]:
-        while True:
-            sessions = await agent_service.get_all_sessions()
-            session_items = [
-                ListSessionItem(
-                    session_id=session.id,
-                    title=session.title,
-                    status=session.status,
-                    unread_message_count=session.unread_message_count,
-                    latest_message=session.latest_message,
-                    latest_message_at=int(session.latest_message_at.timestamp()) if session.latest_message_at else None
-                ) for session in sessions
-            ]
-            yield ServerSentEvent(
-                event="sessions",
-                data=ListSessionResponse(sessions=session_items).model_dump_json()
-            )
-            await asyncio.sleep(SESSION_POLL_INTERVAL)
+        queue = await _session_broadcaster.subscribe(agent_service)
+        try:
+            while True:
+                payload = await queue.get()
+                yield ServerSentEvent(event="sessions", data=payload)
+        finally:
+            await _session_broadcaster.unsubscribe(queue)
     return EventSourceResponse(event_generator())
 
 @router.post("/{session_id}/chat")
@@ -209,47 +286,45 @@ async def vnc_websocket(
 
         logger.info(f"Connecting to VNC WebSocket at {sandbox_ws_url}")
     
-        # Connect to sandbox WebSocket
-        async with websockets.connect(sandbox_ws_url) as sandbox_ws:
+        # Connect to sandbox WebSocket. VNC frames are already-encoded pixel
+        # data, so permessage-deflate only burns zlib CPU and 64 KiB per
+        # connection for near-zero ratio; max_size is lifted for large frames
+        # and max_queue bounds buffering toward slow consumers
+        async with websockets.connect(
+            sandbox_ws_url,
+            compression=None,
+            max_size=None,
+            max_queue=32,
+        ) as sandbox_ws:
             logger.info(f"Connected to VNC WebSocket at {sandbox_ws_url}")
             # Create two tasks to forward data bidirectionally
             async def forward_to_sandbox():
-                try:
-                    while True:
-                        data = await websocket.receive_bytes()
-                        await sandbox_ws.send(data)
-                except WebSocketDisconnect:
-                    logger.info("Web -> VNC connection closed")
-                    pass
-                except Exception as e:
-                    logger.error(f"Error forwarding data to sandbox: {e}")
-            
+                # iter_bytes hands frames straight through and absorbs
+                # the disconnect, avoiding per-frame receive/except work
+                async for data in websocket.iter_bytes():
+                    await sandbox_ws.send(data)
+                logger.info("Web -> VNC connection closed")
+                raise _StreamClosed
+
             async def forward_from_sandbox():
                 try:
-                    while True:
-                        data = await sandbox_ws.recv()
+                    async for data in sandbox_ws:
                         await websocket.send_bytes(data)
                 except websockets.exceptions.ConnectionClosed:
                     logger.info("VNC -> Web connection closed")
-                    pass
-                except Exception as e:
-                    logger.error(f"Error forwarding data from sandbox: {e}")
-            
-            # Run two forwarding tasks concurrently
-            forward_task1 = asyncio.create_task(forward_to_sandbox())
-            forward_task2 = asyncio.create_task(forward_from_sandbox())
-            
-            # Wait for either task to complete (meaning connection has closed)
-            done, pending = await asyncio.wait(
-                [forward_task1, forward_task2],
-                return_when=asyncio.FIRST_COMPLETED
-            )
+                raise _StreamClosed
+
+            # Either direction closing raises the sentinel, which makes the
+            # TaskGroup cancel the sibling and wait for it to finish before
+            # the connection teardown below runs
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(forward_to_sandbox())
+                    tg.create_task(forward_from_sandbox())
+            except* _StreamClosed:
+                pass
 
             logger.info("WebSocket connection closed")
-            
-            # Cancel pending tasks
-            for task in pending:
-                task.cancel()
     
     except ConnectionError as e:
         logger.error(f"Unable to connect to sandbox environment: {str(e)}")
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 import asyncio
@@ -118,7 +119,8 @@ async def lifespan(app: FastAPI):
         await get_redis().shutdown()
         await shutdown()
 
-app = FastAPI(title="Manus AI Agent", lifespan=lifespan)
+# orjson serializes responses several times faster than stdlib json
+app = FastAPI(title="Manus AI Agent", lifespan=lifespan, default_response_class=ORJSONResponse)
 app.dependency_overrides[get_agent_service] = lambda: agent_service
 
 # Create file service instance
@@ -5,7 +5,7 @@ from fastapi import APIRouter, UploadFile, File, Form
 from fastapi.responses import FileResponse
 from app.schemas.file import (
     FileReadRequest, FileWriteRequest, FileReplaceRequest,
-    FileSearchRequest, FileFindRequest
+    FileSearchRequest, FileFindRequest, FileHashRequest
 )
 from app.schemas.response import Response
 from app.services.file import file_service
@@ -106,6 +106,20 @@ async def find_files(request: FileFindRequest):
         data=result.model_dump()
     )
 
+@router.post("/hash", response_model=Response)
+async def hash_file(request: FileHashRequest):
+    """
+    Compute SHA-256 digest of file content
+    """
+    result = await file_service.hash_file(file=request.file)
+
+    # Construct response
+    return Response(
+        success=True,
+        message="File hashed successfully",
+        data=result.model_dump()
+    )
+
 @router.post("/upload")
 async def upload_file(
     file: UploadFile = File(...),
@@ -3,10 +3,10 @@
 """
 from app.models.shell import ShellCommandResult, ShellViewResult, ShellWaitResult, ShellWriteResult, ShellKillResult
 from app.models.supervisor import ProcessInfo, SupervisorActionResult, SupervisorTimeout
-from app.models.file import FileReadResult, FileWriteResult, FileReplaceResult, FileSearchResult, FileFindResult
+from app.models.file import FileReadResult, FileWriteResult, FileReplaceResult, FileSearchResult, FileFindResult, FileHashResult
 
 __all__ = [
     'ShellCommandResult', 'ShellViewResult', 'ShellWaitResult', 'ShellWriteResult', 'ShellKillResult',
     'ProcessInfo', 'SupervisorActionResult', 'SupervisorTimeout',
-    'FileReadResult', 'FileWriteResult', 'FileReplaceResult', 'FileSearchResult', 'FileFindResult'
+    'FileReadResult', 'FileWriteResult', 'FileReplaceResult', 'FileSearchResult', 'FileFindResult', 'FileHashResult'
 ]
@@ -36,6 +36,12 @@ class FileFindResult(BaseModel):
     files: List[str] = Field([], description="List of found files")
 
 
+class FileHashResult(BaseModel):
+    """File hash result"""
+    file: str = Field(..., description="Path of the hashed file")
+    sha256: str = Field(..., description="SHA-256 digest of the file content")
+
+
 class FileUploadResult(BaseModel):
     """File upload result"""
     file_path: str = Field(..., description="Path of the uploaded file")
@@ -23,6 +23,11 @@ class FileWriteRequest(BaseModel):
     sudo: Optional[bool] = Field(False, description="Whether to use sudo privileges")
 
 
+class FileHashRequest(BaseModel):
+    """File hash request"""
+    file: str = Field(..., description="Absolute file path")
+
+
 class FileReplaceRequest(BaseModel):
     """File content replacement request"""
     file: str = Field(..., description="Absolute file path")
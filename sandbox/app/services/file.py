@@ -5,13 +5,14 @@ import os
 import re
 import glob
 import asyncio
+import hashlib
 import subprocess
 import mimetypes
 from typing import Optional, BinaryIO
 from fastapi import UploadFile
 from app.models.file import (
     FileReadResult, FileWriteResult, FileReplaceResult,
-    FileSearchResult, FileFindResult, FileUploadResult
+    FileSearchResult, FileFindResult, FileUploadResult, FileHashResult
 )
 from app.core.exceptions import AppException, ResourceNotFoundException, BadRequestException
 
@@ -286,6 +287,31 @@ class FileService:
         except Exception as e:
             raise AppException(message=f"Failed to upload file: {str(e)}")
 
+    async def hash_file(self, file: str) -> FileHashResult:
+        """
+        Asynchronously compute the SHA-256 digest of a file
+
+        Args:
+            file: Absolute file path
+        """
+        try:
+            self.ensure_file(file)
+
+            def hash_file_async():
+                digest = hashlib.sha256()
+                with open(file, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+                return digest.hexdigest()
+
+            sha256 = await asyncio.to_thread(hash_file_async)
+
+            return FileHashResult(file=file, sha256=sha256)
+        except Exception as e:
+            if isinstance(e, (BadRequestException, ResourceNotFoundException)):
+                raise e
+            raise AppException(message=f"Failed to hash file: {str(e)}")
+
     def ensure_file(self, path: str) -> None:
         """
         Ensure file exists